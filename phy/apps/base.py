@@ -346,10 +346,10 @@ class FeatureMixin(object):
     def _get_spike_features(self, spike_ids, channel_ids):
         data = self.model.get_features(spike_ids, channel_ids)
         assert data.shape[:2] == (len(spike_ids), len(channel_ids))
-        # Replace NaN values by zeros.
-        data[np.isnan(data)] = 0
-        assert data.shape[:2] == (len(spike_ids), len(channel_ids))
-        assert np.isnan(data).sum() == 0
+        # Replace NaN values by zeros, with a single pass on the data.
+        nan = np.isnan(data)
+        if nan.any():
+            data[nan] = 0
         channel_labels = self._get_channel_labels(channel_ids)
         return Bunch(
             data=data, spike_ids=spike_ids, channel_ids=channel_ids, channel_labels=channel_labels)
@@ -577,6 +577,11 @@ class TraceMixin(object):
 
     _new_views = ('TraceView', 'TraceImageView')
 
+    def __init__(self, *args, **kwargs):
+        # Spike times of the last cluster used in the trace view, as (cluster_id, spike_times).
+        self._trace_spike_times_cache = None
+        super(TraceMixin, self).__init__(*args, **kwargs)
+
     def _get_traces(self, interval, show_all_spikes=False):
         """Get traces and spike waveforms."""
         k = self.model.n_samples_waveforms
@@ -604,9 +609,16 @@ class TraceMixin(object):
         cluster_ids = self.supervisor.selected
         if len(cluster_ids) == 0:
             return
+        cluster_id = cluster_ids[0]
+        # Keep the spike times of the last cluster, so that jumping from spike to spike
+        # does not reload them every time. Cluster ids are never reused with different spikes.
+        cached = self._trace_spike_times_cache
+        if cached is not None and cached[0] == cluster_id:
+            return cached[1]
         spc = self.supervisor.clustering.spikes_per_cluster
-        spike_ids = spc[cluster_ids[0]]
+        spike_ids = spc[cluster_id]
         spike_times = self.model.spike_times[spike_ids]
+        self._trace_spike_times_cache = (cluster_id, spike_times)
         return spike_times
 
     def create_trace_view(self):
@@ -855,6 +867,9 @@ class BaseController(object):
         # Set up the cache.
         self._set_cache(clear_cache)
 
+        # Labels of all channels, used to display the best channel of every cluster.
+        self._all_channel_labels = self._get_channel_labels()
+
         # Raw data filter.
         self.raw_data_filter = RawDataFilter()
         self.raw_data_filter.add_default_filter(self.model.sample_rate)
@@ -896,6 +911,14 @@ class BaseController(object):
 
         # Set up the Supervisor instance, responsible for the clustering process.
         self._set_supervisor()
+        # The clusters on every channel change after every clustering action.
+        self._clusters_on_channel = {}
+        # Bumped at every clustering action, so that a list computed in a view thread
+        # from old clusters is never stored in the cache.
+        self._clusters_on_channel_generation = 0
+        connect(self._clear_clusters_on_channel, event='cluster', sender=self.supervisor)
+        # Spikes of the last clusters used in the correlograms, as (cluster_ids, spike_ids, sc).
+        self._correlogram_spikes_cache = None
 
         # Set up the Selector instance, responsible for selecting the spikes for display.
         self._set_selector()
@@ -1147,7 +1170,8 @@ class BaseController(object):
 
     def get_best_channel_label(self, cluster_id):
         """Return the channel label of the best channel, for display in the cluster view."""
-        return self._get_channel_labels([self.get_best_channel(cluster_id)])[0]
+        # This is called for every cluster: use the labels of all channels computed once.
+        return self._all_channel_labels[self.get_best_channel(cluster_id)]
 
     def get_best_channels(self, cluster_id):  # pragma: no cover
         """Return the best channels of a given cluster. To be overriden."""
@@ -1166,11 +1190,24 @@ class BaseController(object):
         channel_id = self.get_best_channel(cluster_id)
         return 0 if channel_id is None else self.model.channel_positions[channel_id, 1]
 
+    def _clear_clusters_on_channel(self, sender, up):
+        self._clusters_on_channel_generation += 1
+        self._clusters_on_channel.clear()
+
     def get_clusters_on_channel(self, channel_id):
         """Return all clusters which have the specified channel among their best channels."""
-        return [
+        # This loops over all clusters: the result is cached until the next clustering action.
+        clusters = self._clusters_on_channel.get(channel_id, None)
+        if clusters is not None:
+            return clusters
+        generation = self._clusters_on_channel_generation
+        clusters = [
             cluster_id for cluster_id in self.supervisor.clustering.cluster_ids
             if channel_id in self.get_best_channels(cluster_id)]
+        # Do not cache the result if a clustering action occurred in the meantime.
+        if generation == self._clusters_on_channel_generation:
+            self._clusters_on_channel[channel_id] = clusters
+        return clusters
 
     # Default similarity functions
     # -------------------------------------------------------------------------
@@ -1370,7 +1407,7 @@ class BaseController(object):
             """Update the order of the clusters when a filtering is applied on the cluster view."""
             if not view.auto_update or cluster_ids is None or not len(cluster_ids):
                 return
-            view.set_cluster_ids(np.sort(cluster_ids))
+            view.set_cluster_ids(np.asarray(sorted(cluster_ids)))
             view.plot()
 
         @connect(sender=view)
@@ -1409,21 +1446,33 @@ class BaseController(object):
     # Correlograms
     # -------------------------------------------------------------------------
 
+    def _get_correlogram_spikes(self, cluster_ids):
+        """Return the spikes used for the correlograms of a set of clusters, and their clusters.
+
+        The selection is shared by the correlograms and their baseline firing rate, which are
+        requested one after the other for the same clusters.
+
+        """
+        key = tuple(cluster_ids)
+        cached = self._correlogram_spikes_cache
+        if cached is None or cached[0] != key:
+            spike_ids = self.selector.select_spikes(
+                cluster_ids, self.n_spikes_correlograms, subset='random')
+            sc = self.supervisor.clustering.spike_clusters[spike_ids]
+            cached = self._correlogram_spikes_cache = (key, spike_ids, sc)
+        return cached[1], cached[2]
+
     def _get_correlograms(self, cluster_ids, bin_size, window_size):
         """Return the cross- and auto-correlograms of a set of clusters."""
-        spike_ids = self.selector.select_spikes(
-            cluster_ids, self.n_spikes_correlograms, subset='random')
+        spike_ids, sc = self._get_correlogram_spikes(cluster_ids)
         st = self.model.spike_times[spike_ids]
-        sc = self.supervisor.clustering.spike_clusters[spike_ids]
         return correlograms(
             st, sc, sample_rate=self.model.sample_rate, cluster_ids=cluster_ids,
             bin_size=bin_size, window_size=window_size)
 
     def _get_correlograms_rate(self, cluster_ids, bin_size):
         """Return the baseline firing rate of the cross- and auto-correlograms of clusters."""
-        spike_ids = self.selector.select_spikes(
-            cluster_ids, self.n_spikes_correlograms, subset='random')
-        sc = self.supervisor.clustering.spike_clusters[spike_ids]
+        _, sc = self._get_correlogram_spikes(cluster_ids)
         return firing_rate(
             sc, cluster_ids=cluster_ids, bin_size=bin_size, duration=self.model.duration)
 
@@ -1473,18 +1522,22 @@ class BaseController(object):
     def _make_spike_attributes_view(self, view_name, name, arr):
         """Create a special class deriving from ScatterView for each spike attribute."""
         def coords(cluster_ids, load_all=False):
+            # Select the spikes of every cluster like the amplitude view, and return the
+            # collated coordinates of all clusters in a single Bunch.
             n = self.n_spikes_amplitudes if not load_all else None
-            bunchs = []
-            for cluster_id in cluster_ids:
-                spike_ids = self.get_spike_ids(cluster_id, n=n)
-                if arr.ndim == 1:
-                    x = self.model.spike_times[spike_ids]
-                    y = arr[spike_ids]
-                    assert x.shape == y.shape == (len(spike_ids),)
-                elif arr.ndim >= 2:
-                    x, y = arr[spike_ids, :2].T
-                bunchs.append(Bunch(x=x, y=y, spike_ids=spike_ids, data_bounds=None))
-            return bunchs
+            spike_ids = np.concatenate(
+                [self.get_spike_ids(cluster_id, n=n) for cluster_id in cluster_ids] or
+                [np.array([], dtype=np.int64)])
+            if arr.ndim == 1:
+                x = self.model.spike_times[spike_ids]
+                y = arr[spike_ids]
+                assert x.shape == y.shape == (len(spike_ids),)
+            elif arr.ndim >= 2:
+                x, y = arr[spike_ids, :2].T
+            spike_clusters = self.supervisor.clustering.spike_clusters[spike_ids]
+            return Bunch(
+                x=x, y=y, spike_ids=spike_ids, spike_clusters=spike_clusters, data_bounds=None,
+                alpha=.75)
 
         # Dynamic type deriving from ScatterView.
         view_cls = type(view_name, (ScatterView,), {})
@@ -1544,9 +1597,10 @@ class BaseController(object):
                     v.ex_status = filter_name
                     v.update_status()
             # Update the waveform view.
+            cluster_ids = self.supervisor.selected
             for v in gui.list_views(WaveformView):
                 if v.auto_update:
-                    v.on_select_threaded(self.supervisor, self.supervisor.selected, gui=gui)
+                    v.on_select_threaded(self.supervisor, cluster_ids, gui=gui)
                     v.ex_status = filter_name
                     v.update_status()
 
@@ -44,6 +44,17 @@ def _backup(path):
         shutil.copy(path, path_backup)
 
 
+def _best_channels(mm):
+    """Return the channels sorted by decreasing mean mask, keeping those above .1."""
+    # NOTE: use a stable sort so that channels with the same mean mask always come in
+    # decreasing channel order, whatever the platform or the numpy sorting backend.
+    # Only sort the channels that are kept.
+    kept = np.nonzero(mm > .1)[0]
+    if len(kept) > 0:
+        return kept[np.argsort(mm[kept], kind='stable')[::-1]]
+    return np.argsort(mm, kind='stable')[::-1][:4]
+
+
 class KwikModelGUI(KwikModel):
     @property
     def features(self):
@@ -168,26 +179,31 @@ class KwikController(WaveformMixin, FeatureMixin, TraceMixin, BaseController):
 
         self.supervisor = supervisor
 
-    def _get_masks(self, cluster_id):
-        spike_ids = self.selector.select_spikes(
+    def _get_waveform_spike_ids(self, cluster_id):
+        return self.selector.select_spikes(
             [cluster_id], self.n_spikes_waveforms, self.batch_size_waveforms)
+
+    def _load_masks(self, spike_ids):
         if self.model.all_masks is None:
             return np.ones((self.n_spikes_waveforms, self.model.n_channels))
         return self.model.all_masks[spike_ids]
 
+    def _get_masks(self, cluster_id):
+        return self._load_masks(self._get_waveform_spike_ids(cluster_id))
+
     def _get_mean_masks(self, cluster_id):
         return np.mean(self._get_masks(cluster_id), axis=0)
 
     def _get_waveforms(self, cluster_id):
         """Return a selection of waveforms for a cluster."""
         pos = self.model.channel_positions
-        spike_ids = self.selector.select_spikes(
-            [cluster_id], self.n_spikes_waveforms, self.batch_size_waveforms)
+        # Select the spikes once, and load the waveforms and masks of these spikes.
+        spike_ids = self._get_waveform_spike_ids(cluster_id)
         data = self.model.all_waveforms[spike_ids]
-        mm = self._get_mean_masks(cluster_id)
+        masks = self._load_masks(spike_ids)
+        mm = np.mean(masks, axis=0)
         mw = np.mean(data, axis=0)
         amp = get_waveform_amplitude(mm, mw)
-        masks = self._get_masks(cluster_id)
         # Find the best channels.
         channel_ids = np.argsort(amp)[::-1]
         return Bunch(
@@ -209,14 +225,7 @@ class KwikController(WaveformMixin, FeatureMixin, TraceMixin, BaseController):
 
     def get_best_channels(self, cluster_id):
         """Get the best channels of a given cluster."""
-        mm = self._get_mean_masks(cluster_id)
-        channel_ids = np.argsort(mm)[::-1]
-        ind = mm[channel_ids] > .1
-        if np.sum(ind) > 0:
-            channel_ids = channel_ids[ind]
-        else:  # pragma: no cover
-            channel_ids = channel_ids[:4]
-        return channel_ids
+        return _best_channels(self._get_mean_masks(cluster_id))
 
     def on_save_clustering(self, sender, spike_clusters, groups, *labels):
         """Save the modified data."""
@@ -11,12 +11,15 @@ from pathlib import Path
 import shutil
 import unittest
 
+import numpy as np
+from numpy.testing import assert_array_equal as ae
+
 from phylib.io.datasets import download_test_file
 from phylib.utils.testing import captured_output
 
 from phy.apps.tests.test_base import BaseControllerTests
 from phy.plot.tests import key_press
-from ..gui import KwikController, kwik_describe
+from ..gui import KwikController, kwik_describe, _best_channels
 from phy.cluster.views import WaveformView
 
 logger = logging.getLogger(__name__)
@@ -36,6 +39,12 @@ def _kwik_controller(tempdir, kwik_only=False):
         clear_cache=True, enable_threading=False)
 
 
+def test_best_channels():
+    # Channels with tied mean masks come in decreasing channel order.
+    ae(_best_channels(np.array([1, 1, 1, .5, 1, 0])), [4, 2, 1, 0, 3])
+    ae(_best_channels(np.array([0, .05, .08])), [2, 1, 0])
+
+
 def test_kwik_describe(qtbot, tempdir):
     temp_path = download_test_file('kwik/hybrid_10sec.kwik')
     kwik_path = tempdir / temp_path.name
@@ -8,7 +8,6 @@
 #------------------------------------------------------------------------------
 
 import logging
-from operator import itemgetter
 from pathlib import Path
 
 import numpy as np
@@ -158,16 +157,19 @@ class TemplateController(WaveformMixin, FeatureMixin, TemplateMixin, TraceMixin,
         # The similarity of the cluster with each template.
         sims = np.max(self.model.similar_templates[temp_i, :], axis=0)
 
-        def _sim_ij(cj):
-            # Templates of the cluster.
-            if cj < self.model.n_templates:
-                return float(sims[cj])
-            temp_j = np.nonzero(self.get_template_counts(cj))[0]
-            return float(np.max(sims[temp_j]))
-
-        out = [(cj, _sim_ij(cj)) for cj in self.supervisor.clustering.cluster_ids]
+        cluster_ids = np.asarray(self.supervisor.clustering.cluster_ids)
+        out = np.empty(len(cluster_ids))
+        # Clusters that are still templates: the similarity is directly given by sims.
+        is_template = cluster_ids < self.model.n_templates
+        out[is_template] = sims[cluster_ids[is_template]]
+        # Other clusters: maximum similarity with each of their templates.
+        for k in np.nonzero(~is_template)[0]:
+            temp_j = np.nonzero(self.get_template_counts(cluster_ids[k]))[0]
+            out[k] = np.max(sims[temp_j])
         # NOTE: hard-limit to 100 for performance reasons.
-        return sorted(out, key=itemgetter(1), reverse=True)[:100]
+        # The stable sort keeps the order of the clusters with the same similarity.
+        best = np.argsort(-out, kind='stable')[:100]
+        return [(int(cluster_ids[k]), float(out[k])) for k in best]
 
     def get_template_amplitude(self, template_id):
         """Return the maximum amplitude of a template's waveforms across all channels."""
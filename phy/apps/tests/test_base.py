@@ -15,6 +15,8 @@ import tempfile
 import unittest
 
 import numpy as np
+from numpy.testing import assert_array_equal as ae
+from numpy.testing import assert_allclose as ac
 from pytestqt.plugin import QtBot
 
 from phylib.io.mock import (
@@ -30,6 +32,7 @@ from phy.cluster.views import (
 from phy.gui.qt import Debouncer, create_app
 from phy.gui.widgets import Barrier
 from phy.plot.tests import mouse_click
+from phy.utils.color import selected_cluster_color
 from ..base import BaseController, WaveformMixin, FeatureMixin, TraceMixin, TemplateMixin
 
 logger = logging.getLogger(__name__)
@@ -117,8 +120,8 @@ class MyControllerFull(TemplateMixin, WaveformMixin, FeatureMixin, TraceMixin, M
     pass
 
 
-def _mock_controller(tempdir, cls):
-    model = MyModel()
+def _mock_controller(tempdir, cls, model=None):
+    model = model or MyModel()
     return cls(
         dir_path=tempdir, config_dir=tempdir / 'config', model=model,
         clear_cache=True, enable_threading=False)
@@ -372,6 +375,18 @@ class MockControllerTests(MinimalControllerTests, GlobalViewsTests, unittest.Tes
     def get_controller(cls, tempdir):
         return _mock_controller(tempdir, MyController)
 
+    def test_clusters_on_channel(self):
+        # Fill the cache of the clusters on every channel.
+        for channel_id in range(self.model.n_channels):
+            self.controller.get_clusters_on_channel(channel_id)
+        # Merge two clusters through the merge action.
+        self.supervisor.select_actions.select(list(self.cluster_ids[:2]))
+        self.supervisor.block()
+        self.merge()
+        new_cluster_id, = self.selected
+        channel_id = self.controller.get_best_channel(new_cluster_id)
+        self.assertIn(new_cluster_id, self.controller.get_clusters_on_channel(channel_id))
+
     def test_create_ipython_view(self):
         self.gui.create_and_add_view('IPythonView')
 
@@ -381,6 +396,39 @@ class MockControllerTests(MinimalControllerTests, GlobalViewsTests, unittest.Tes
         view.actions.next_color_scheme()
 
 
+class MockControllerSpikeAttributesTests(MinimalControllerTests, unittest.TestCase):
+    """Mock controller with a spike attribute."""
+
+    @classmethod
+    def get_controller(cls, tempdir):
+        model = MyModel()
+        model.spike_attributes = {'myattr': np.random.uniform(size=model.n_spikes)}
+        return _mock_controller(tempdir, MyController, model=model)
+
+    def test_spike_attributes_view(self):
+        view = self.gui.create_and_add_view('SpikeMyattrView')
+        cluster_ids = list(self.cluster_ids[:2])
+        view.cluster_ids = cluster_ids
+        bunch, = view.get_clusters_data()
+        spike_ids = bunch.spike_ids
+
+        # Coordinates.
+        ac(bunch.pos[:, 0], self.model.spike_times[spike_ids], rtol=1e-6)
+        ac(bunch.pos[:, 1], self.model.spike_attributes['myattr'][spike_ids], rtol=1e-6)
+        ae(bunch.spike_clusters, self.supervisor.clustering.spike_clusters[spike_ids])
+        self.assertEqual(set(bunch.spike_clusters), set(cluster_ids))
+        # The spikes are selected cluster by cluster.
+        for cluster_id in cluster_ids:
+            ae(
+                spike_ids[bunch.spike_clusters == cluster_id],
+                self.controller.get_spike_ids(cluster_id, n=self.controller.n_spikes_amplitudes))
+
+        # Colors.
+        for i, cluster_id in enumerate(cluster_ids):
+            color = bunch.color[bunch.spike_clusters == cluster_id]
+            ac(color, np.broadcast_to(selected_cluster_color(i, .75), color.shape))
+
+
 class MockControllerWTests(MinimalControllerTests, unittest.TestCase):
     """Mock controller with waveforms."""
 
@@ -78,9 +78,11 @@ def _extend_assignment(spike_ids, old_spike_clusters, spike_clusters_rel, new_cl
         (spike_ids, new_spike_clusters), (extended_spike_ids, extended_spike_clusters))
 
 
-def _assign_update_info(spike_ids, old_spike_clusters, new_spike_clusters):
-    old_clusters = _unique(old_spike_clusters)
-    new_clusters = _unique(new_spike_clusters)
+def _assign_update_info(
+        spike_ids, old_spike_clusters, new_spike_clusters, old_clusters=None, new_clusters=None):
+    # The unique old and new clusters can be passed if they were already computed.
+    old_clusters = old_clusters if old_clusters is not None else _unique(old_spike_clusters)
+    new_clusters = new_clusters if new_clusters is not None else _unique(new_spike_clusters)
     largest_old_cluster = np.bincount(old_spike_clusters).argmax()
     descendants = list(set(zip(old_spike_clusters, new_spike_clusters)))
     update_info = UpdateInfo(
@@ -263,7 +265,9 @@ class Clustering(object):
             return self._do_merge(spike_ids, old_clusters, new_clusters[0])
 
         # We return the UpdateInfo structure.
-        up = _assign_update_info(spike_ids, old_spike_clusters, new_spike_clusters)
+        up = _assign_update_info(
+            spike_ids, old_spike_clusters, new_spike_clusters,
+            old_clusters=old_clusters, new_clusters=new_clusters)
 
         # We update the new cluster id (strictly increasing during a session).
         self._new_cluster_id = max(self._new_cluster_id, max(up.added) + 1)
@@ -732,22 +732,33 @@ class Supervisor(object):
         sim = self.similarity(cluster_id) or []
         # Only keep existing clusters.
         clusters_set = set(self.clustering.cluster_ids)
+        fields = self.cluster_meta.fields
         data = [
-            dict(similarity='%.3f' % s, **self.get_cluster_info(c))
+            dict(similarity='%.3f' % s, **self.get_cluster_info(c, fields=fields))
             for c, s in sim if c in clusters_set]
         return data
 
-    def get_cluster_info(self, cluster_id, exclude=()):
-        """Return the data associated to a given cluster."""
+    def get_cluster_info(self, cluster_id, exclude=(), fields=None):
+        """Return the data associated to a given cluster.
+
+        The list of cluster metadata `fields` may be passed when this method is called on many
+        clusters, so that it is computed only once.
+
+        """
         out = {'id': cluster_id}
         # Cluster metrics.
         for key, func in self.cluster_metrics.items():
-            out[key] = func(cluster_id)
+            # Skip the computation of excluded metrics.
+            if key not in exclude:
+                out[key] = func(cluster_id)
         # Cluster meta.
-        for key in self.cluster_meta.fields:
+        fields = fields if fields is not None else self.cluster_meta.fields
+        for key in fields:
             # includes group
             out[key] = self.cluster_meta.get(key, cluster_id)
         out['is_masked'] = _is_group_masked(out.get('group', None))
+        if not exclude:
+            return out
         return {k: v for k, v in out.items() if k not in exclude}
 
     def _create_views(self, gui=None, sort=None):
@@ -781,7 +792,8 @@ class Supervisor(object):
     def _clusters_added(self, cluster_ids):
         """Update the cluster and similarity views when new clusters are created."""
         logger.log(5, "Clusters added: %s", cluster_ids)
-        data = [self.get_cluster_info(cluster_id) for cluster_id in cluster_ids]
+        fields = self.cluster_meta.fields
+        data = [self.get_cluster_info(cluster_id, fields=fields) for cluster_id in cluster_ids]
         self.cluster_view.add(data)
         self.similarity_view.add(data)
 
@@ -913,7 +925,10 @@ class Supervisor(object):
     @property
     def cluster_info(self):
         """The cluster view table as a list of per-cluster dictionaries."""
-        return [self.get_cluster_info(cluster_id) for cluster_id in self.clustering.cluster_ids]
+        fields = self.cluster_meta.fields
+        return [
+            self.get_cluster_info(cluster_id, fields=fields)
+            for cluster_id in self.clustering.cluster_ids]
 
     @property
     def shown_cluster_ids(self):
@@ -1000,7 +1015,11 @@ class Supervisor(object):
     @property
     def selected(self):
         """Selected clusters in the cluster and similarity views."""
-        return _uniq(self.selected_clusters + self.selected_similar)
+        # Read the last state only once instead of via selected_clusters and selected_similar.
+        state = self.task_logger.last_state()
+        if not state:
+            return []
+        return _uniq((state[0] or []) + (state[2] or []))
 
     def n_spikes(self, cluster_id):
         """Number of spikes in a given cluster."""
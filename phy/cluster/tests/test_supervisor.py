@@ -320,6 +320,12 @@ def test_supervisor_cluster_metrics(
 
     assert 'my_metrics' in mc.columns
 
+    info = mc.get_cluster_info(cluster_ids[1])
+    assert info['my_metrics'] == cluster_ids[1] ** 2
+    info = mc.get_cluster_info(cluster_ids[1], exclude=('my_metrics',))
+    assert 'my_metrics' not in info
+    assert info['id'] == cluster_ids[1]
+
 
 def test_supervisor_select_1(qtbot, supervisor):
     # WARNING: always use actions in tests, because this doesn't call
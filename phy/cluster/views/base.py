@@ -32,9 +32,9 @@ def _get_bunch_bounds(bunch):
     """Return the data bounds of a bunch."""
     if 'data_bounds' in bunch and bunch.data_bounds is not None:
         return bunch.data_bounds
-    xmin, ymin = bunch.pos.min(axis=0)
-    xmax, ymax = bunch.pos.max(axis=0)
-    return (xmin, ymin, xmax, ymax)
+    # NOTE: reducing each column is much faster than reducing the (n, 2) array along axis 0.
+    x, y = bunch.pos[:, 0], bunch.pos[:, 1]
+    return (x.min(), y.min(), x.max(), y.max())
 
 
 class ManualClusteringView(object):
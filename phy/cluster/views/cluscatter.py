@@ -115,14 +115,18 @@ class ClusterScatterView(MarkerSizeMixin, BaseColorView, BaseGlobalView, ManualC
     def bindings(self):
         return {k: getattr(self, k) for k in self._dims}
 
-    def get_cluster_data(self, cluster_id):
+    def get_cluster_data(self, cluster_id, bindings=None):
         """Return the data of one cluster."""
         data = self.cluster_info(cluster_id)
-        return {k: data.get(v, 0.) for k, v in self.bindings.items()}
+        bindings = bindings or self.bindings
+        return {k: data.get(v, 0.) for k, v in bindings.items()}
 
     def get_clusters_data(self, cluster_ids):
         """Return the data of a set of clusters, as a dictionary {cluster_id: Bunch}."""
-        return {cluster_id: self.get_cluster_data(cluster_id) for cluster_id in cluster_ids}
+        bindings = self.bindings
+        return {
+            cluster_id: self.get_cluster_data(cluster_id, bindings=bindings)
+            for cluster_id in cluster_ids}
 
     def set_cluster_ids(self, all_cluster_ids):
         """Update the cluster data by specifying the list of all cluster ids."""
@@ -138,8 +142,7 @@ class ClusterScatterView(MarkerSizeMixin, BaseColorView, BaseGlobalView, ManualC
 
     def set_fields(self):
         data = self.cluster_info(self.all_cluster_ids[0])
-        self.fields = sorted(data.keys())
-        self.fields = [f for f in self.fields if not isinstance(data[f], str)]
+        self.fields = sorted(k for k, v in data.items() if not isinstance(v, str))
 
     def prepare_data(self):
         """Prepare the marker position, size, and color from the cluster information."""
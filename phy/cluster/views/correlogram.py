@@ -110,15 +110,16 @@ class CorrelogramView(ScalingMixin, ManualClusteringView):
         assert ccg.ndim == 3
         n_bins = ccg.shape[2]
         bunchs = []
-        m = ccg.max()
+        if self.uniform_normalization:
+            m = np.full(ccg.shape[0], ccg.max())
+        else:
+            # Normalization row per row, computed once for all rows.
+            m = ccg.max(axis=(1, 2))
         for i, j in self._iter_subplots(len(self.cluster_ids)):
             b = Bunch()
             b.correlogram = ccg[i, j, :]
-            if not self.uniform_normalization:
-                # Normalization row per row.
-                m = ccg[i, :, :].max()
             b.firing_rate = fr[i, j] if fr is not None else None
-            b.data_bounds = (0, 0, n_bins, m)
+            b.data_bounds = (0, 0, n_bins, m[i])
             b.pair_index = i, j
             b.color = selected_cluster_color(i, 1)
             if i != j:
@@ -260,7 +261,7 @@ class CorrelogramView(ScalingMixin, ManualClusteringView):
 
     def set_refractory_period(self, value):
         """Set the refractory period (in milliseconds)."""
-        self.refractory_period = np.clip(value, .1, 100) * 1e-3
+        self.refractory_period = min(max(value, .1), 100) * 1e-3
         self.plot()
 
     def set_bin(self, bin_size):
@@ -37,6 +37,11 @@ def _get_default_grid():
     return [[_ for _ in re.split(' +', line.strip())] for line in s.splitlines()]
 
 
+def _parse_grid(grid_dim):
+    """Split every `dim_x,dim_y` item of a grid specification into a `(dim_x, dim_y)` pair."""
+    return [[tuple(dim.split(',')) for dim in row] for row in grid_dim]
+
+
 def _get_point_color(clu_idx=None):
     if clu_idx is not None:
         color = selected_cluster_color(clu_idx, .5)
@@ -114,6 +119,7 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
         self._lim = 1
 
         self.grid_dim = _get_default_grid()  # 2D array where every item a string like `0A,1B`
+        self._grid_dims = _parse_grid(self.grid_dim)  # same, split into (dim_x, dim_y) pairs
         self.n_rows, self.n_cols = np.array(self.grid_dim).shape
         self.canvas.set_layout('grid', shape=(self.n_rows, self.n_cols))
         self.canvas.enable_lasso()
@@ -148,6 +154,7 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
 
         """
         self.grid_dim = grid_dim
+        self._grid_dims = _parse_grid(grid_dim)
         self.n_rows, self.n_cols = np.array(grid_dim).shape
         self.canvas.grid.shape = (self.n_rows, self.n_cols)
 
@@ -158,8 +165,7 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
         """Yield (i, j, dim)."""
         for i in range(self.n_rows):
             for j in range(self.n_cols):
-                dim = self.grid_dim[i][j]
-                dim_x, dim_y = dim.split(',')
+                dim_x, dim_y = self._grid_dims[i][j]
                 yield i, j, dim_x, dim_y
 
     def _get_axis_label(self, dim):
@@ -216,9 +222,20 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
 
     def _plot_points(self, bunch, clu_idx=None):
         cluster_id = self.cluster_ids[clu_idx] if clu_idx is not None else None
+        # These do not depend on the subplot.
+        color = _get_point_color(clu_idx)
+        size = self._marker_size
+        # The same dimension appears in several subplots: only load its data once.
+        axis_data = {}
+
+        def _get_data(dim):
+            if dim not in axis_data:
+                axis_data[dim] = self._get_axis_data(bunch, dim, cluster_id=cluster_id)
+            return axis_data[dim]
+
         for i, j, dim_x, dim_y in self._iter_subplots():
-            px = self._get_axis_data(bunch, dim_x, cluster_id=cluster_id)
-            py = self._get_axis_data(bunch, dim_y, cluster_id=cluster_id)
+            px = _get_data(dim_x)
+            py = _get_data(dim_y)
             # Skip empty data.
             if px is None or py is None:  # pragma: no cover
                 logger.warning("Skipping empty data for cluster %d.", cluster_id)
@@ -234,13 +251,18 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
             # for the selected cluster.
             self.visual.add_batch_data(
                 x=px.data, y=py.data,
-                color=_get_point_color(clu_idx),
+                color=color,
                 # Reduced marker size for background features
-                size=self._marker_size,
+                size=size,
                 masks=_get_point_masks(clu_idx=clu_idx, masks=masks),
                 data_bounds=data_bounds,
                 box_index=(i, j),
             )
+
+    def _plot_labels(self):
+        """Add the axis labels of all subplots, once for all clusters."""
+        self.text_visual.reset_batch()
+        for i, j, dim_x, dim_y in self._iter_subplots():
             # Get the channel ids corresponding to the relative channel indices
             # specified in the dimensions. Channel 0 corresponds to the first
             # best channel for the selected cluster, and so on.
@@ -308,12 +330,14 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
         common_channels = list(channel_ids)
         # Intersection (with order kept) of channels belonging to all clusters.
         for bunch in bunchs:
-            common_channels = [c for c in bunch.channel_ids if c in common_channels]
+            common_set = set(common_channels)
+            common_channels = [c for c in bunch.channel_ids if c in common_set]
         # The selected channels will be (1) the channels common to all clusters, followed
         # by (2) remaining channels from the first cluster (excluding those already selected
         # in (1)).
         n = len(channel_ids)
-        not_common_channels = [c for c in channel_ids if c not in common_channels]
+        common_set = set(common_channels)
+        not_common_channels = [c for c in channel_ids if c not in common_set]
         channel_ids = common_channels + not_common_channels[:n - len(common_channels)]
         assert len(channel_ids) > 0
 
@@ -357,7 +381,6 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
 
         # Plot points.
         self.visual.reset_batch()
-        self.text_visual.reset_batch()
 
         self._plot_points(background)  # background spikes
 
@@ -365,6 +388,9 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
         for clu_idx, bunch in enumerate(bunchs):
             self._plot_points(bunch, clu_idx=clu_idx)
 
+        # The labels are the same for all clusters.
+        self._plot_labels()
+
         # Upload the data on the GPU.
         self.canvas.update_visual(self.visual)
         self.canvas.update_visual(self.text_visual)
@@ -406,7 +432,7 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
         assert len(channels) >= 2
         # Get the axis from the pressed button (1, 2, etc.)
         if key is not None:
-            d = np.clip(len(channels) - 1, 0, key - 1)
+            d = min(max(len(channels) - 1, 0), key - 1)
         else:
             d = 0 if button == 'Left' else 1
         # Change the first or second best channel.
@@ -416,8 +442,9 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
             return
         channels[d] = channel_id
         # Ensure that the first two channels are different.
-        if channels[1 - min(d, 1)] == channel_id:
-            channels[1 - min(d, 1)] = old
+        other = 1 if d == 0 else 0
+        if channels[other] == channel_id:
+            channels[other] = old
         assert channels[0] != channels[1]
         # Remove duplicate channels.
         self.channel_ids = _uniq(channels)
@@ -432,8 +459,7 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
         if 'Alt' in e.modifiers:
             # Get mouse position in NDC.
             (i, j), _ = self.canvas.grid.box_map(e.pos)
-            dim = self.grid_dim[i][j]
-            dim_x, dim_y = dim.split(',')
+            dim_x, dim_y = self._grid_dims[i][j]
             dim = dim_x if b == 'Left' else dim_y
             other_dim = dim_y if b == 'Left' else dim_x
             if dim not in self.attributes:
@@ -460,8 +486,7 @@ class FeatureView(MarkerSizeMixin, ScalingMixin, ManualClusteringView):
 
         # Get the dimensions of the lassoed subplot.
         i, j = self.canvas.layout.active_box
-        dim = self.grid_dim[i][j]
-        dim_x, dim_y = dim.split(',')
+        dim_x, dim_y = self._grid_dims[i][j]
 
         # Get all points from all clusters.
         pos = []
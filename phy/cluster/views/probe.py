@@ -98,6 +98,8 @@ class ProbeView(ManualClusteringView):
 
         # Cluster visual.
         self.cluster_visual = ScatterVisual()
+        # Clusters whose channels are currently uploaded in the cluster visual.
+        self._shown_cluster_ids = None
         self.canvas.add_visual(self.cluster_visual)
 
         # Text visual
@@ -150,6 +152,11 @@ class ProbeView(ManualClusteringView):
         self.cluster_ids = cluster_ids
         if not cluster_ids:
             return
+        # Skip the GPU upload if the same clusters are already shown (cluster ids are never
+        # reused, so their channels have not changed).
+        if list(cluster_ids) == self._shown_cluster_ids:
+            return
+        self._shown_cluster_ids = list(cluster_ids)
         pos, colors = self._get_clu_positions(cluster_ids)
         self.cluster_visual.set_data(
             pos=pos, color=colors, size=self.selected_marker_size, data_bounds=self.data_bounds)
@@ -12,7 +12,8 @@ import logging
 
 import numpy as np
 
-from phy.utils.color import selected_cluster_color, spike_colors
+from phylib.utils import Bunch
+from phy.utils.color import selected_cluster_colors, spike_colors
 from .base import ManualClusteringView, MarkerSizeMixin, LassoMixin
 from phy.plot.visuals import ScatterVisual
 
@@ -23,6 +24,37 @@ logger = logging.getLogger(__name__)
 # Scatter view
 # -----------------------------------------------------------------------------
 
+def _get_pos(bunch):
+    """Return the `(n, 2)` positions of a Bunch, built from its x and y attributes if needed."""
+    if 'pos' in bunch:
+        pos = bunch.pos
+    else:
+        x, y = bunch.x, bunch.y
+        assert x.ndim == 1
+        assert x.shape == y.shape
+        # Fill a contiguous array directly instead of stacking x and y. Keep float64, as
+        # the positions are normalized on the CPU before being cast to float32.
+        pos = np.empty((x.shape[0], 2), dtype=np.float64)
+        pos[:, 0] = x
+        pos[:, 1] = y
+    assert pos.ndim == 2
+    return pos
+
+
+def _concatenate_bunchs(bunchs):
+    """Merge the per-cluster data into a single Bunch with one color per point, so that all
+    clusters are plotted in a single batch item."""
+    # Fast path for the common case of a single cluster: no copy, a single color.
+    if len(bunchs) == 1:
+        return Bunch(pos=bunchs[0].pos, color=bunchs[0].color)
+    pos = np.concatenate([bunch.pos for bunch in bunchs])
+    color = np.concatenate([
+        np.broadcast_to(np.asarray(bunch.color, dtype=np.float32), (len(bunch.pos), 4))
+        for bunch in bunchs])
+    assert color.shape == (pos.shape[0], 4)
+    return Bunch(pos=pos, color=color)
+
+
 class ScatterView(MarkerSizeMixin, LassoMixin, ManualClusteringView):
     """This view displays a scatter plot for all selected clusters.
 
@@ -30,7 +62,9 @@ class ScatterView(MarkerSizeMixin, LassoMixin, ManualClusteringView):
     -----------
 
     coords : function
-        Maps `cluster_ids` to a list `[Bunch(x, y, spike_ids, data_bounds), ...]` for each cluster.
+        Maps `cluster_ids` to a list `[Bunch(x, y, spike_ids, data_bounds), ...]` for each cluster,
+        or to a single `Bunch(x, y, spike_ids, spike_clusters, data_bounds, alpha=1.)` for all
+        clusters.
 
     """
 
@@ -58,27 +92,23 @@ class ScatterView(MarkerSizeMixin, LassoMixin, ManualClusteringView):
 
     def _get_split_cluster_data(self, bunchs):
         """Get the data when there is one Bunch per cluster."""
+        # Colors of the selected clusters, computed once before the loop.
+        palette = selected_cluster_colors(len(bunchs), .75)
         # Add a pos attribute in bunchs in addition to x and y.
-        for i, (cluster_id, bunch) in enumerate(zip(self.cluster_ids, bunchs)):
-            bunch.cluster_id = cluster_id
-            if 'pos' not in bunch:
-                assert bunch.x.ndim == 1
-                assert bunch.x.shape == bunch.y.shape
-                bunch.pos = np.c_[bunch.x, bunch.y]
-            assert bunch.pos.ndim == 2
+        for cluster_id, bunch, color in zip(self.cluster_ids, bunchs, palette):
             assert 'spike_ids' in bunch
-            bunch.color = selected_cluster_color(i, .75)
+            bunch.cluster_id = cluster_id
+            bunch.pos = _get_pos(bunch)
+            bunch.color = color
         return bunchs
 
     def _get_collated_cluster_data(self, bunch):
         """Get the data when there is a single Bunch for all selected clusters."""
         assert 'spike_ids' in bunch
-        if 'pos' not in bunch:
-            assert bunch.x.ndim == 1
-            assert bunch.x.shape == bunch.y.shape
-            bunch.pos = np.c_[bunch.x, bunch.y]
-        assert bunch.pos.ndim == 2
+        bunch.pos = _get_pos(bunch)
+        # spike_colors() already returns a new RGBA array: set the alpha channel in place.
         bunch.color = spike_colors(bunch.spike_clusters, self.cluster_ids)
+        bunch.color[:, 3] = bunch.get('alpha', 1.)
         return bunch
 
     def get_clusters_data(self, load_all=None):
@@ -109,8 +139,7 @@ class ScatterView(MarkerSizeMixin, LassoMixin, ManualClusteringView):
         self.data_bounds = self._get_data_bounds(bunchs)
 
         self.visual.reset_batch()
-        for bunch in bunchs:
-            self._plot_cluster(bunch)
+        self._plot_cluster(_concatenate_bunchs(bunchs))
         self.canvas.update_visual(self.visual)
         self.visual.show()
 
@@ -35,10 +35,28 @@ def test_probe_view(qtbot, gui):
     class Supervisor(object):
         pass
 
+    # Count the uploads of the cluster positions.
+    set_data = v.cluster_visual.set_data
+    calls = []
+
+    def _set_data(*args, **kwargs):
+        calls.append(1)
+        return set_data(*args, **kwargs)
+    v.cluster_visual.set_data = _set_data
+
     v.toggle_show_labels(True)
     v.on_select(cluster_ids=[])
     v.on_select(cluster_ids=[0])
     v.on_select(cluster_ids=[0, 2, 3])
+    assert len(calls) == 2
+
+    # Same selection: the cluster visual is not updated.
+    v.on_select(cluster_ids=[0, 2, 3])
+    assert len(calls) == 2
+
+    # Different selection: the cluster visual is updated.
+    v.on_select(cluster_ids=[0, 2])
+    assert len(calls) == 3
     emit('select', Supervisor(), cluster_ids=[0, 2])
 
     v.toggle_show_labels(False)
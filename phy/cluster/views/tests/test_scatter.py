@@ -11,7 +11,7 @@ from pytest import raises
 
 from phylib.utils import Bunch
 from phy.plot.tests import mouse_click
-from ..scatter import ScatterView
+from ..scatter import ScatterView, _concatenate_bunchs
 from . import _stop_and_close
 
 
@@ -19,6 +19,20 @@ from . import _stop_and_close
 # Test scatter view
 #------------------------------------------------------------------------------
 
+def test_concatenate_bunchs():
+    b0 = Bunch(pos=np.zeros((3, 2)), color=(1, 0, 0, 1))
+    b1 = Bunch(pos=np.ones((2, 2)), color=np.full((2, 4), .5))
+    b = _concatenate_bunchs([b0, b1])
+    assert b.pos.shape == (5, 2)
+    assert b.color.shape == (5, 4)
+    assert np.all(b.color[:3] == (1, 0, 0, 1))
+    assert np.all(b.color[3:] == .5)
+
+    b = _concatenate_bunchs([b0])
+    assert b.pos is b0.pos
+    assert b.color == (1, 0, 0, 1)
+
+
 def test_scatter_view_0(qtbot, gui):
     v = ScatterView(
         coords=lambda cluster_ids, load_all=False: None
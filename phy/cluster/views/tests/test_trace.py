@@ -22,6 +22,15 @@ from . import _stop_and_close
 # Test trace view
 #------------------------------------------------------------------------------
 
+def test_select_traces():
+    traces = 1e3 + artificial_traces(100, 3)
+    for dtype, out_dtype in ((np.int16, np.float32), (np.float64, np.float64)):
+        tr = select_traces(traces.astype(dtype), [.01, .05], sample_rate=1000.)
+        assert tr.dtype == out_dtype
+        ac(tr, traces.astype(dtype)[10:50] - np.median(traces.astype(dtype)[10:50], axis=0),
+           rtol=0, atol=1e-4 if dtype == np.int16 else 1e-12)
+
+
 def test_iter_spike_waveforms():
     nc = 5
     ns = 20
@@ -32,9 +32,12 @@ def select_traces(traces, interval, sample_rate=None):
     i, j = round(sample_rate * start), round(sample_rate * end)
     i, j = int(i), int(j)
     traces = traces[i:j, :]
-    traces = traces - np.median(traces, axis=0)
     if isinstance(traces, da.Array):  # pragma: no cover
         traces = traces.compute()
+    # Copy into a single float buffer and remove the median in place. Integer traces are
+    # converted to float32, floating-point traces keep their precision.
+    traces = np.array(traces, dtype=np.result_type(traces.dtype, np.float32))
+    traces -= np.median(traces, axis=0)
     return traces
 
 
@@ -46,38 +49,39 @@ def _iter_spike_waveforms(
     p = supervisor
     sr = m.sample_rate
     a, b = m.spike_times.searchsorted(interval)
+    # Load the spike times and clusters in the interval once.
+    spike_times = m.spike_times[a:b]
+    spike_clusters = m.spike_clusters[a:b]
+    selected = p.selected
     s0, s1 = int(round(interval[0] * sr)), int(round(interval[1] * sr))
     ns = n_samples_waveforms
     k = ns // 2
-    for show_selected in (False, True):
-        for i in range(a, b):
-            t = m.spike_times[i]
-            c = m.spike_clusters[i]
-            is_selected = c in p.selected
-            # Show non selected spikes first, then selected spikes so that they appear on top.
-            if is_selected is not show_selected:
-                continue
-            # Skip non-selected spikes if requested.
-            if (not show_all_spikes and c not in supervisor.selected):
-                continue
-            # cg = p.cluster_meta.get('group', c)
-            channel_ids = get_best_channels(c)
-            s = int(round(t * sr)) - s0
-            # Skip partial spikes.
-            if s - k < 0 or s + k >= (s1 - s0):  # pragma: no cover
-                continue
-            # Extract the waveform.
-            wave = Bunch(
-                data=traces_interval[s - k:s + ns - k, channel_ids],
-                channel_ids=channel_ids,
-                start_time=(s + s0 - k) / sr,
-                spike_id=i,
-                spike_time=t,
-                spike_cluster=c,
-                select_index=p.selected.index(c) if c in p.selected else None,
-            )
-            assert wave.data.shape == (ns, len(channel_ids))
-            yield wave
+    # Only keep the spikes to show, with non selected spikes first, then selected spikes
+    # so that they appear on top.
+    is_selected = np.isin(spike_clusters, selected)
+    idx = np.nonzero(is_selected)[0]
+    if show_all_spikes:
+        idx = np.concatenate((np.nonzero(~is_selected)[0], idx))
+    for j in idx:
+        i, t, c = a + j, spike_times[j], spike_clusters[j]
+        # cg = p.cluster_meta.get('group', c)
+        channel_ids = get_best_channels(c)
+        s = int(round(t * sr)) - s0
+        # Skip partial spikes.
+        if s - k < 0 or s + k >= (s1 - s0):  # pragma: no cover
+            continue
+        # Extract the waveform.
+        wave = Bunch(
+            data=traces_interval[s - k:s + ns - k, channel_ids],
+            channel_ids=channel_ids,
+            start_time=(s + s0 - k) / sr,
+            spike_id=i,
+            spike_time=t,
+            spike_cluster=c,
+            select_index=selected.index(c) if c in selected else None,
+        )
+        assert wave.data.shape == (ns, len(channel_ids))
+        yield wave
 
 
 class TraceView(ScalingMixin, BaseColorView, ManualClusteringView):
@@ -231,22 +235,23 @@ class TraceView(ScalingMixin, BaseColorView, ManualClusteringView):
         assert traces.shape == (n_ch, n_samples)
         color = color or self.default_trace_color
 
+        # The time coordinates are the same for all channels: broadcast instead of tiling.
         t = self._interval[0] + np.arange(n_samples) * self.dt
-        t = np.tile(t, (n_ch, 1))
+        t = np.broadcast_to(t, (n_ch, n_samples))
 
-        box_index = self.channel_y_ranks
-        box_index = np.repeat(box_index[:, np.newaxis], n_samples, axis=1)
+        # One box index per vertex, directly as a 1D array.
+        box_index = np.repeat(self.channel_y_ranks, n_samples)
 
         assert t.shape == (n_ch, n_samples)
         assert traces.shape == (n_ch, n_samples)
-        assert box_index.shape == (n_ch, n_samples)
+        assert box_index.shape == (n_ch * n_samples,)
 
         self.trace_visual.color = color
         self.canvas.update_visual(
             self.trace_visual,
             t, traces,
             data_bounds=self.data_bounds,
-            box_index=box_index.ravel(),
+            box_index=box_index,
         )
 
     def _plot_spike(self, bunch):
@@ -318,8 +323,8 @@ class TraceView(ScalingMixin, BaseColorView, ManualClusteringView):
         elif end >= self.duration:
             start -= (end - self.duration)
             end = self.duration
-        start = np.clip(start, 0, end)
-        end = np.clip(end, start, self.duration)
+        start = min(max(start, 0), end)
+        end = min(max(end, start), self.duration)
         assert 0 <= start < end <= self.duration
         return start, end
 
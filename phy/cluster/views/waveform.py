@@ -8,6 +8,7 @@
 # -----------------------------------------------------------------------------
 
 from collections import defaultdict
+from functools import lru_cache
 import logging
 
 import numpy as np
@@ -61,6 +62,16 @@ def _overlap_transform(t, offset=0, n=1, overlap=None):
     return t
 
 
+@lru_cache(maxsize=8)
+def _tick_positions(wave_duration):
+    """Return the x coordinates, in [-1, 1], of a vertical tick every millisecond."""
+    steps = np.arange(np.round(wave_duration * 1000))
+    x = -1 + 2 * (.001 * steps) / wave_duration
+    # The array is shared by all clusters and all plots.
+    x.flags.writeable = False
+    return x
+
+
 class WaveformView(ScalingMixin, ManualClusteringView):
     """This view shows the waveforms of the selected clusters, on relevant channels,
     following the probe geometry.
@@ -225,11 +236,12 @@ class WaveformView(ScalingMixin, ManualClusteringView):
         masks += bunch.index
 
         # Generate the box index (one number per channel).
-        box_index = _index_of(channel_ids_loc, self.channel_ids)
-        box_index = np.tile(box_index, n_spikes_clu)
+        channel_box_index = _index_of(channel_ids_loc, self.channel_ids)
+        box_index = np.tile(channel_box_index, n_spikes_clu)
 
         # Find the correct number of vertices depending on the current waveform visual.
-        if self._current_visual == self.waveform_visual:
+        visual = self._current_visual
+        if visual == self.waveform_visual:
             # PlotVisual
             box_index = np.repeat(box_index, n_samples)
             assert box_index.size == n_spikes_clu * n_channels * n_samples
@@ -244,7 +256,7 @@ class WaveformView(ScalingMixin, ManualClusteringView):
         wave = wave.reshape((nw, n_samples))
 
         assert self.data_bounds is not None
-        self._current_visual.add_batch_data(
+        visual.add_batch_data(
             x=t, y=wave, color=bunch.color, masks=masks, box_index=box_index,
             data_bounds=self.data_bounds)
 
@@ -255,8 +267,7 @@ class WaveformView(ScalingMixin, ManualClusteringView):
         ax_db = self.data_bounds
         a, b = _overlap_transform(
             np.array([-1, 1]), offset=bunch.offset, n=bunch.n_clu, overlap=self.overlap)
-        box_index = _index_of(channel_ids_loc, self.channel_ids)
-        box_index = np.repeat(box_index, 2)
+        box_index = np.repeat(channel_box_index, 2)
         box_index = np.tile(box_index, n_spikes_clu)
         hpos = np.tile([[a, 0, b, 0]], (nw, 1))
         assert box_index.size == hpos.shape[0] * 2
@@ -267,18 +278,13 @@ class WaveformView(ScalingMixin, ManualClusteringView):
             box_index=box_index,
         )
 
-        # Vertical ticks every millisecond.
-        steps = np.arange(np.round(self.wave_duration * 1000))
-        # A vline every millisecond.
-        x = .001 * steps
-        # Scale to [-1, 1], same coordinates as the waveform points.
-        x = -1 + 2 * x / self.wave_duration
+        # Vertical ticks every millisecond, in the same coordinates as the waveform points.
+        x = _tick_positions(self.wave_duration)
         # Take overlap into account.
         x = _overlap_transform(x, offset=bunch.offset, n=bunch.n_clu, overlap=self.overlap)
         x = np.tile(x, len(channel_ids_loc))
         # Generate the box index.
-        box_index = _index_of(channel_ids_loc, self.channel_ids)
-        box_index = np.repeat(box_index, x.size // len(box_index))
+        box_index = np.repeat(channel_box_index, x.size // len(channel_box_index))
         assert x.size == box_index.size
         self.tick_visual.add_batch_data(
             x=x, y=np.zeros_like(x),
@@ -320,9 +326,10 @@ class WaveformView(ScalingMixin, ManualClusteringView):
         # Channel labels.
         channel_labels = {}
         for d in bunchs:
-            chl = d.get('channel_labels', ['%d' % ch for ch in d.channel_ids])
-            channel_labels.update({
-                channel_id: chl[i] for i, channel_id in enumerate(d.channel_ids)})
+            chl = d.get('channel_labels', None)
+            if chl is None:
+                chl = ['%d' % ch for ch in d.channel_ids]
+            channel_labels.update(zip(d.channel_ids, chl))
 
         # Update the Boxed box positions as a function of the selected channels.
         if channel_ids:
@@ -330,22 +337,23 @@ class WaveformView(ScalingMixin, ManualClusteringView):
 
         self.data_bounds = self.data_bounds or self._get_data_bounds(bunchs)
 
-        self._current_visual.reset_batch()
+        visual = self._current_visual
+        visual.reset_batch()
         self.line_visual.reset_batch()
         self.tick_visual.reset_batch()
         for bunch in bunchs:
             self._plot_cluster(bunch)
         self.canvas.update_visual(self.tick_visual)
         self.canvas.update_visual(self.line_visual)
-        self.canvas.update_visual(self._current_visual)
+        self.canvas.update_visual(visual)
 
         self._plot_labels(channel_ids, len(self.cluster_ids), channel_labels)
 
         # Only show the current waveform visual.
-        if self._current_visual == self.waveform_visual:
+        if visual == self.waveform_visual:
             self.waveform_visual.show()
             self.waveform_agg_visual.hide()
-        elif self._current_visual == self.waveform_agg_visual:
+        elif visual == self.waveform_agg_visual:
             self.waveform_agg_visual.show()
             self.waveform_visual.hide()
 
@@ -10,11 +10,17 @@ from functools import partial
 from pathlib import Path
 from pytest import yield_fixture, mark
 
+import numpy as np
+
 from phylib.utils import connect, unconnect
+from phylib.utils._misc import read_text
 from phylib.utils.testing import captured_logging
 import phy
+from phy.utils.color import colormaps
 from .test_qt import _block
-from ..widgets import HTMLWidget, Table, Barrier, IPythonView, KeyValueWidget
+from ..qt import _static_abs_path
+from ..widgets import (
+    HTMLWidget, Table, Barrier, IPythonView, KeyValueWidget, _color_styles, _read_static)
 
 
 #------------------------------------------------------------------------------
@@ -60,6 +66,25 @@ def table(qtbot):
 # Test widgets
 #------------------------------------------------------------------------------
 
+def test_color_styles():
+    # The CSS is cached as long as the colormap does not change.
+    css = _color_styles()
+    assert css is _color_styles()
+    # One rule per colormap color, with the color of the first cluster.
+    n = len(colormaps.default)
+    assert '.color-%d ' % (n - 1) in css
+    assert '.color-%d ' % n not in css
+    r, g, b = (colormaps.default[0] * 255).astype(np.int32)
+    assert 'rgb(%d, %d, %d)' % (r, g, b) in css
+
+
+def test_read_static():
+    html = _read_static('index.html')
+    assert html is _read_static('index.html')
+    assert html == read_text(_static_abs_path('index.html'))
+    assert '<html' in html
+
+
 def test_widget_empty(qtbot):
     widget = HTMLWidget()
     widget.build()
@@ -9,7 +9,9 @@
 
 import json
 import logging
-from functools import partial
+from functools import partial, lru_cache
+
+import numpy as np
 
 from qtconsole.rich_jupyter_widget import RichJupyterWidget
 from qtconsole.inprocess import QtInProcessKernelManager
@@ -19,7 +21,7 @@ from .qt import (
     QLabel, QLineEdit, QCheckBox, QSpinBox, QDoubleSpinBox,
     pyqtSlot, _static_abs_path, _block, is_high_dpi, Debouncer)
 from phylib.utils import emit, connect
-from phy.utils.color import colormaps, _is_bright
+from phy.utils.color import colormaps, _are_bright
 from phylib.utils._misc import _CustomEncoder, read_text, _pretty_floats
 from phylib.utils._types import _is_integer
 
@@ -149,6 +151,12 @@ _PAGE_TEMPLATE = """
 """
 
 
+@lru_cache(maxsize=None)
+def _read_static(filename):
+    """Read a static file once, the contents do not change during the lifetime of the process."""
+    return read_text(_static_abs_path(filename))
+
+
 def _uniq(seq):
     """Return the list of unique integers in a sequence, by keeping the order."""
     seen = set()
@@ -221,8 +229,7 @@ class HTMLBuilder(object):
 
     def set_body_src(self, filename):
         """Set the path to an HTML file containing the body of the widget."""
-        path = _static_abs_path(filename)
-        self.set_body(read_text(path))
+        self.set_body(_read_static(filename))
 
     def set_body(self, body):
         """Set the HTML body of the widget."""
@@ -336,15 +343,31 @@ def dumps(o):
 
 
 def _color_styles():
-    """Use colormap colors in table widget."""
+    """Use colormap colors in table widget.
+
+    The CSS only depends on the default colormap, so it is cached and recomputed only if the
+    colormap changes.
+
+    """
+    return _make_color_styles(np.asarray(colormaps.default, dtype=np.float64).tobytes())
+
+
+@lru_cache(maxsize=None)
+def _make_color_styles(colormap_bytes):
+    """Generate the CSS of the colormap colors, given the raw bytes of a float64 colormap."""
+    colormap = np.frombuffer(colormap_bytes, dtype=np.float64).reshape((-1, 3))
+    rgb = colormap * 255
+    # Compute all integer triplets and brightness flags at once rather than per color.
+    rgb_int = rgb.astype(np.int32).tolist()
+    bright = _are_bright(rgb).tolist()
     return '\n'.join(
         '''
         #table .color-%d > td[class='id'] {
             background-color: rgb(%d, %d, %d);
             %s
         }
-        ''' % (i, r, g, b, 'color: #000 !important;' if _is_bright((r, g, b)) else '')
-        for i, (r, g, b) in enumerate(colormaps.default * 255))
+        ''' % (i, r, g, b, 'color: #000 !important;' if is_bright else '')
+        for i, ((r, g, b), is_bright) in enumerate(zip(rgb_int, bright)))
 
 
 class Table(HTMLWidget):
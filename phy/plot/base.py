@@ -685,14 +685,18 @@ class BaseCanvas(QOpenGLWindow):
             # Draw all visuals, clearable first, non clearable last.
             visuals = [v for v in self.visuals if v.get('clearable', True)]
             visuals += [v for v in self.visuals if not v.get('clearable', True)]
-            logger.log(5, "Draw %d visuals.", len(visuals))
+            # Check the log level once per frame rather than once per visual.
+            log_draw = logger.isEnabledFor(5)
+            if log_draw:
+                logger.log(5, "Draw %d visuals.", len(visuals))
             for v in visuals:
                 visual = v.visual
                 if size != self._size:
                     visual.on_resize(*size)
                 # Do not draw if there are no vertices.
                 if not visual._hidden and visual.n_vertices > 0 and size[0] > 10 and size[1] > 10:
-                    logger.log(5, "Draw visual `%s`.", visual)
+                    if log_draw:
+                        logger.log(5, "Draw visual `%s`.", visual)
                     visual.on_draw()
             self._size = size
         except Exception as e:  # pragma: no cover
@@ -899,7 +903,7 @@ class BaseLayout(object):
                 self.box_var in visual.program and
                 ((visual.program[self.box_var] is None) or
                  (visual.program[self.box_var].shape[0] != visual.n_vertices))):
-            logger.log(5, "Set %s(%d) for %s" % (self.box_var, visual.n_vertices, visual))
+            logger.log(5, "Set %s(%d) for %s", self.box_var, visual.n_vertices, visual)
             visual.program[self.box_var] = _get_array(
                 self.active_box, (visual.n_vertices, self.n_dims)).astype(np.float32)
 
@@ -45,6 +45,14 @@ def _is_bright(rgb):
         return True
 
 
+def _are_bright(rgb):
+    """Vectorized version of `_is_bright()` for an `(n, 3)` array of RGB colors."""
+    rgb = np.asarray(rgb, dtype=np.float64)
+    c = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    L = c @ np.array([0.2126, 0.7152, 0.0722])
+    return (L + 0.05) / (0.0 + 0.05) > (1.0 + 0.05) / (L + 0.05)
+
+
 def _random_bright_color():
     """Generate a random bright color."""
     rgb = _random_color()
@@ -159,6 +167,12 @@ def selected_cluster_color(i, alpha=1.):
     return add_alpha(tuple(colormaps.default[i % len(colormaps.default)]), alpha=alpha)
 
 
+def selected_cluster_colors(n, alpha=1.):
+    """Return the colors, as a `(n, 4)` array, of the first n selected clusters."""
+    cmap = colormaps.default
+    return add_alpha(cmap[np.arange(n) % len(cmap)], alpha=alpha)
+
+
 def spike_colors(spike_clusters, cluster_ids):
     """Return the colors of spikes according to the index of their cluster within `cluster_ids`.
 
@@ -13,9 +13,10 @@ from numpy.testing import assert_almost_equal as ae
 from pytest import raises
 
 from ..color import (
-    _is_bright, _random_bright_color, spike_colors, add_alpha, selected_cluster_color,
+    _is_bright, _are_bright, _random_bright_color, spike_colors, add_alpha, selected_cluster_color,
     _override_hsv, _hex_to_triplet, _continuous_colormap, _categorical_colormap,
-    _selected_cluster_idx, ClusterColorSelector, _add_selected_clusters_colors)
+    _selected_cluster_idx, ClusterColorSelector, _add_selected_clusters_colors,
+    selected_cluster_colors)
 
 
 #------------------------------------------------------------------------------
@@ -27,6 +28,12 @@ def test_random_color():
         assert _is_bright(_random_bright_color())
 
 
+def test_are_bright():
+    rgb = np.random.rand(20, 3)
+    rgb[0] = 0
+    assert list(_are_bright(rgb)) == [bool(_is_bright(c)) for c in rgb]
+
+
 def test_hex_to_triplet():
     assert _hex_to_triplet('#0123ab')
 
@@ -49,6 +56,14 @@ def test_selected_cluster_color():
     assert len(c) == 4
 
 
+def test_selected_cluster_colors():
+    c = selected_cluster_colors(100, .5)
+    assert c.shape == (100, 4)
+    for i in (0, 1, 99):
+        ae(c[i], selected_cluster_color(i, .5))
+    assert selected_cluster_colors(0).shape == (0, 4)
+
+
 def test_colormaps():
     colormap = np.array(cc.glasbey_bw_minc_20_minl_30)
     values = np.random.randint(10, 20, size=100)